@@ -2,6 +2,7 @@
 Search Routes
 Hybrid RAG search (vector + knowledge graph) using LlamaIndex Hybrid Property Graph
 """
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException, Depends, Request
 from supabase import Client
@@ -10,7 +11,11 @@ from app.core.config import settings
 from app.core.security import get_current_user_context
 from app.core.dependencies import get_supabase
 from app.core import dependencies as deps
-from app.models.schemas import SearchQuery, SearchResponse, VectorResult, GraphResult
+from app.models.schemas import (
+    SearchQuery, SearchResponse, VectorResult, GraphResult,
+    BatchSearchQuery, BatchSearchResponse
+)
+from app.models.schemas.search import MAX_BATCH_QUERIES
 from app.services.search.query_rewriter import rewrite_query_with_context
 from app.middleware.rate_limit import limiter
 from app.core.circuit_breakers import with_openai_retry
@@ -19,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["search"])
 
+# /search and /search/batch draw from one bucket: 30 searches per minute in total
+SEARCH_RATE_LIMIT = "30/minute"
+
 
 async def _get_query_engine(company_id: str):
     """Create query engine on-demand for this request"""
@@ -38,8 +46,105 @@ async def _execute_search_with_retry(engine, query_text: str, filters: dict = No
     return await engine.query(query_text, filters=filters)
 
 
+async def _run_search(query: SearchQuery, engine, company_id: str, supabase: Client) -> SearchResponse:
+    """
+    Run one search against an initialized query engine.
+
+    Shared by /search and /search/batch (the batch endpoint reuses one engine
+    for all of its queries). The query rewrite (sync OpenAI call) and Supabase
+    lookups (sync .execute()) run in worker threads, so concurrent searches don't
+    serialize on the event loop.
+    """
+    # Query rewriting with conversation context
+    conversation_hist = [
+        msg.dict() for msg in query.conversation_history
+    ] if query.conversation_history else []
+
+    rewritten_query = await asyncio.to_thread(rewrite_query_with_context, query.query, conversation_hist)
+
+    logger.info(f"Search - Original: {query.query}")
+    logger.info(f"Search - Rewritten: {rewritten_query}")
+
+    # Build metadata filters for company isolation
+    metadata_filters = {"company_id": company_id}
+    if hasattr(query, 'filters') and query.filters:
+        metadata_filters.update(query.filters)
+
+    # Execute query using hybrid retrieval with automatic retry on failures
+    result = await _execute_search_with_retry(engine, rewritten_query, filters=metadata_filters)
+
+    # Extract episode_ids and metadata from source nodes
+    episode_ids = set()
+    vector_results = []
+
+    for i, node in enumerate(result.get('source_nodes', [])):
+        metadata = node.metadata
+        episode_id = metadata.get("episode_id", "")
+
+        if episode_id:
+            episode_ids.add(episode_id)
+
+        # If file_url not in metadata, fetch from documents table (for old chunks)
+        if not metadata.get("file_url") and metadata.get("document_id"):
+            try:
+                doc_result = await asyncio.to_thread(
+                    supabase.table("documents").select("file_url,mime_type,file_size_bytes").eq(
+                        "id", metadata["document_id"]
+                    ).single().execute
+                )
+                if doc_result.data:
+                    metadata["file_url"] = doc_result.data.get("file_url")
+                    metadata["mime_type"] = doc_result.data.get("mime_type")
+                    metadata["file_size_bytes"] = doc_result.data.get("file_size_bytes")
+            except Exception as e:
+                logger.warning(f"Failed to fetch file_url for document {metadata['document_id']}: {e}")
+
+        vector_results.append(VectorResult(
+            id=str(i),
+            document_name=metadata.get("document_name", "Unknown"),
+            source=metadata.get("source", "Unknown"),
+            document_type=metadata.get("document_type", "Unknown"),
+            content=node.text[:query.text_preview_chars] if query.text_preview_chars else node.text,
+            chunk_index=metadata.get("chunk_index", 0),
+            episode_id=episode_id,
+            similarity=node.score if hasattr(node, 'score') and node.score else 0.0,
+            metadata=metadata
+        ))
+
+    # Graph data is integrated into hybrid retrieval automatically
+    graph_results = []
+
+    # Optionally fetch full emails from Supabase
+    full_emails = None
+    if query.include_full_emails and episode_ids:
+        try:
+            emails_result = await asyncio.to_thread(
+                supabase.table("emails").select("*").in_(
+                    "episode_id", list(episode_ids)
+                ).eq(
+                    "company_id", company_id
+                ).execute
+            )
+
+            full_emails = emails_result.data if emails_result.data else []
+            logger.info(f"Fetched {len(full_emails)} full email(s) for {len(episode_ids)} episode(s)")
+        except Exception as e:
+            logger.warning(f"Failed to fetch full emails: {e}")
+
+    return SearchResponse(
+        success=True,
+        query=query.query,
+        answer=result['answer'],
+        vector_results=vector_results,
+        graph_results=graph_results,
+        num_episodes=len(episode_ids),
+        message=f"Found {len(vector_results)} source nodes across {len(episode_ids)} episodes",
+        full_emails=full_emails
+    )
+
+
 @router.post("/search", response_model=SearchResponse)
-@limiter.limit("30/minute")  # 30 searches per minute per IP
+@limiter.shared_limit(SEARCH_RATE_LIMIT, scope="search")  # 30 searches per minute per IP
 async def search(
     request: Request,
     query: SearchQuery,
@@ -69,95 +174,71 @@ async def search(
     user_id = user_context["user_id"]
     company_id = user_context["company_id"]
     try:
-        # Query rewriting with conversation context
-        conversation_hist = [
-            msg.dict() for msg in query.conversation_history
-        ] if query.conversation_history else []
-
-        rewritten_query = rewrite_query_with_context(query.query, conversation_hist)
-
-        logger.info(f"Search - Original: {query.query}")
-        logger.info(f"Search - Rewritten: {rewritten_query}")
-
         # Initialize hybrid query engine (per-request)
         engine = await _get_query_engine(company_id)
 
-        # Build metadata filters for company isolation
-        metadata_filters = {"company_id": company_id}
-        if hasattr(query, 'filters') and query.filters:
-            metadata_filters.update(query.filters)
+        return await _run_search(query, engine, company_id, supabase)
 
-        # Execute query using hybrid retrieval with automatic retry on failures
-        result = await _execute_search_with_retry(engine, rewritten_query, filters=metadata_filters)
-
-        # Extract episode_ids and metadata from source nodes
-        episode_ids = set()
-        vector_results = []
+    except Exception as e:
+        logger.error(f"Search error: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}"
+        )
 
-        for i, node in enumerate(result.get('source_nodes', [])):
-            metadata = node.metadata
-            episode_id = metadata.get("episode_id", "")
 
-            if episode_id:
-                episode_ids.add(episode_id)
+@router.post("/search/batch", response_model=BatchSearchResponse)
+@limiter.shared_limit(SEARCH_RATE_LIMIT, scope="search", cost=MAX_BATCH_QUERIES)  # Charged as a full batch
+async def search_batch(
+    request: Request,
+    batch: BatchSearchQuery,
+    user_context: dict = Depends(get_current_user_context),
+    supabase: Client = Depends(get_supabase)
+):
+    """
+    Run several searches in one HTTP round-trip.
 
-            # If file_url not in metadata, fetch from documents table (for old chunks)
-            if not metadata.get("file_url") and metadata.get("document_id"):
-                try:
-                    doc_result = supabase.table("documents").select("file_url,mime_type,file_size_bytes").eq(
-                        "id", metadata["document_id"]
-                    ).single().execute()
-                    if doc_result.data:
-                        metadata["file_url"] = doc_result.data.get("file_url")
-                        metadata["mime_type"] = doc_result.data.get("mime_type")
-                        metadata["file_size_bytes"] = doc_result.data.get("file_size_bytes")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch file_url for document {metadata['document_id']}: {e}")
-
-            vector_results.append(VectorResult(
-                id=str(i),
-                document_name=metadata.get("document_name", "Unknown"),
-                source=metadata.get("source", "Unknown"),
-                document_type=metadata.get("document_type", "Unknown"),
-                content=node.text,
-                chunk_index=metadata.get("chunk_index", 0),
-                episode_id=episode_id,
-                similarity=node.score if hasattr(node, 'score') and node.score else 0.0,
-                metadata=metadata
-            ))
-
-        # Graph data is integrated into hybrid retrieval automatically
-        graph_results = []
-
-        # Optionally fetch full emails from Supabase
-        full_emails = None
-        if query.include_full_emails and episode_ids:
-            try:
-                emails_result = supabase.table("emails").select("*").in_(
-                    "episode_id", list(episode_ids)
-                ).eq(
-                    "company_id", company_id
-                ).execute()
+    All queries share one authenticated request and one query engine, and run
+    concurrently. Results come back in the order the queries were sent; a
+    failed query yields success=False in its slot instead of failing the batch.
 
-                full_emails = emails_result.data if emails_result.data else []
-                logger.info(f"Fetched {len(full_emails)} full email(s) for {len(episode_ids)} episode(s)")
-            except Exception as e:
-                logger.warning(f"Failed to fetch full emails: {e}")
-
-        return SearchResponse(
-            success=True,
-            query=query.query,
-            answer=result['answer'],
-            vector_results=vector_results,
-            graph_results=graph_results,
-            num_episodes=len(episode_ids),
-            message=f"Found {len(vector_results)} source nodes across {len(episode_ids)} episodes",
-            full_emails=full_emails
-        )
+    Args:
+        batch: {"queries": [SearchQuery, ...]}
+        user_context: Authenticated user context (user_id + company_id from JWT)
+        supabase: Supabase client (dependency injection)
 
+    Returns:
+        BatchSearchResponse: One SearchResponse per query, in request order
+    """
+    company_id = user_context["company_id"]
+    try:
+        # One engine for the whole batch (engine setup is the expensive part)
+        engine = await _get_query_engine(company_id)
     except Exception as e:
-        logger.error(f"Search error: {str(e)}", exc_info=True)
+        logger.error(f"Batch search error: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Search failed: {str(e)}"
         )
+
+    outcomes = await asyncio.gather(
+        *(_run_search(query, engine, company_id, supabase) for query in batch.queries),
+        return_exceptions=True
+    )
+
+    results = []
+    for query, outcome in zip(batch.queries, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Batch search error for '{query.query}': {outcome}")
+            outcome = SearchResponse(
+                success=False,
+                query=query.query,
+                answer="",
+                vector_results=[],
+                graph_results=[],
+                num_episodes=0,
+                message=f"Search failed: {outcome}"
+            )
+        results.append(outcome)
+
+    return BatchSearchResponse(results=results)
@@ -0,0 +1,68 @@
+"""
+Tenant Routes
+Cache invalidation webhook for company context and prompt templates
+"""
+import hashlib
+import hmac
+import logging
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, Request, status
+
+from app.core.config import settings
+from app.services.tenant.context import publish_invalidation, reload_caches
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/tenant", tags=["tenant"])
+
+
+@router.post("/cache/invalidate")
+async def invalidate_tenant_cache(
+    request: Request,
+    x_signature: Optional[str] = Header(default=None)
+):
+    """
+    Invalidate cached company context and prompt templates.
+
+    Called by a Supabase database webhook (or admin tooling) after edits to
+    companies / company_team_members / company_prompts, so running workers
+    pick up changes without a redeploy.
+
+    Publishes the invalidation over Redis so every other API and dramatiq worker
+    process refreshes its caches, then reloads them here. The old caches keep
+    serving until the reload publishes, so no request does a blocking fetch.
+
+    SECURITY: X-Signature must be the hex HMAC-SHA256 of the raw request body
+    using CACHE_INVALIDATION_SECRET (timing-safe comparison).
+    """
+    if not settings.cache_invalidation_secret:
+        logger.error("Cache invalidation attempted but CACHE_INVALIDATION_SECRET not configured")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Cache invalidation not configured"
+        )
+
+    if not x_signature:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Signature required (X-Signature header)"
+        )
+
+    body = await request.body()
+    expected = hmac.new(
+        settings.cache_invalidation_secret.encode("utf-8"),
+        body,
+        hashlib.sha256
+    ).hexdigest()
+
+    if not hmac.compare_digest(x_signature, expected):
+        logger.warning("Invalid cache invalidation signature")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid signature"
+        )
+
+    publish_invalidation()
+    await reload_caches()
+
+    return {"success": True, "message": "Tenant caches invalidated"}
@@ -42,6 +42,7 @@ class Settings(BaseSettings):
     
     # Multi-tenancy (HighForce is always multi-tenant)
     is_multi_tenant: bool = Field(default=True, description="Enable multi-tenant mode (always True for HighForce)")
+    company_id: Optional[str] = Field(default=None, description="Company UUID whose context + prompts this deployment serves")
 
     # ============================================================================
     # DATABASE (Supabase PostgreSQL) - ONE INSTANCE FOR EVERYTHING!
@@ -87,6 +88,7 @@ class Settings(BaseSettings):
     # ============================================================================
 
     cortex_api_key: Optional[str] = Field(default=None, description="API key for external API access (optional)")
+    cache_invalidation_secret: Optional[str] = Field(default=None, description="HMAC secret for the tenant cache invalidation webhook (optional)")
 
     # ============================================================================
     # SPAM FILTERING
@@ -102,6 +104,7 @@ class Settings(BaseSettings):
 
     # Error tracking (Sentry)
     sentry_dsn: Optional[str] = Field(default=None, description="Sentry DSN for error tracking")
+    enable_sentry_debug: bool = Field(default=False, description="Expose /sentry-debug (never in production)")
 
     # ============================================================================
     # OPTIONAL SETTINGS
@@ -9,9 +9,9 @@ DEPENDENCIES:
 - HTTP client (for external APIs)
 """
 import logging
-from typing import Generator
+from typing import Generator, Optional
 import httpx
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from qdrant_client import QdrantClient
 import redis
 
@@ -26,6 +26,13 @@ logger = logging.getLogger(__name__)
 # Supabase client (singleton)
 _supabase_client: Client = None
 
+# Master Supabase client (company context + prompts) - same unified database,
+# shares the pooled service-role client above
+master_supabase_client: Client = None
+
+# PostgREST request timeout (seconds) for the shared Supabase client
+SUPABASE_POSTGREST_TIMEOUT = 10
+
 # Qdrant client (singleton)
 _qdrant_client: QdrantClient = None
 
@@ -40,22 +47,35 @@ query_engine = None
 # INITIALIZATION (called on app startup)
 # ============================================================================
 
+def _create_supabase_client() -> Client:
+    """
+    Create the process-wide service-role Supabase client.
+
+    The PostgREST client inside keeps a persistent httpx connection pool, so
+    creating it ONCE per process means every table().select().execute() call
+    reuses a warm TCP+TLS connection instead of opening a new one.
+    """
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_service_key,  # Backend uses service role
+        options=ClientOptions(postgrest_client_timeout=SUPABASE_POSTGREST_TIMEOUT)
+    )
+
+
 async def initialize_clients():
     """
     Initialize all global clients on app startup.
 
     Called from main.py lifespan event.
     """
-    global _supabase_client, _qdrant_client, _redis_client, query_engine
+    global _supabase_client, master_supabase_client, _qdrant_client, _redis_client, query_engine
 
     logger.info("Initializing global clients...")
 
     # Supabase
     try:
-        _supabase_client = create_client(
-            settings.supabase_url,
-            settings.supabase_service_key  # Backend uses service role
-        )
+        _supabase_client = _create_supabase_client()
+        master_supabase_client = _supabase_client
         logger.info("✅ Supabase client initialized")
     except Exception as e:
         logger.error(f"❌ Failed to initialize Supabase: {e}")
@@ -109,7 +129,7 @@ async def shutdown_clients():
 
     Called from main.py lifespan event.
     """
-    global _supabase_client, _qdrant_client, _redis_client
+    global _supabase_client, master_supabase_client, _qdrant_client, _redis_client
 
     logger.info("Shutting down global clients...")
 
@@ -131,6 +151,7 @@ async def shutdown_clients():
 
     # Supabase doesn't need explicit cleanup
     _supabase_client = None
+    master_supabase_client = None
 
     logger.info("✅ All clients shutdown complete")
 
@@ -199,6 +220,15 @@ def get_redis() -> redis.Redis:
     return _redis_client
 
 
+def get_redis_optional() -> Optional[redis.Redis]:
+    """
+    Get Redis client if available (None when Redis is down or not configured).
+
+    For best-effort caches that must keep working without Redis.
+    """
+    return _redis_client
+
+
 def get_http_client() -> Generator[httpx.AsyncClient, None, None]:
     """
     Get HTTP client for external API calls.
@@ -9,19 +9,23 @@ BREAKING CHANGES from old CORTEX:
 - RLS policies enforce isolation at database level
 
 SECURITY FEATURES:
-- JWT validation via Supabase
+- JWT validation via Supabase (result cached in Redis per token, see _get_cached_user_context)
 - API key authentication with timing-safe comparison
 - company_id in JWT custom claim (no query needed)
 - RLS ensures database-level isolation
 """
 import logging
 import hmac
+import time
+from hashlib import blake2b
 from typing import Dict, Optional
+import jwt
+import orjson
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, APIKeyHeader
 from supabase import Client
 
-from app.core.dependencies import get_supabase
+from app.core.dependencies import get_supabase, get_redis_optional
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -31,10 +35,55 @@ bearer_scheme = HTTPBearer()
 api_key_scheme = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+# Validated user contexts are reused for at most this long (or until the JWT expires,
+# whichever is sooner) so revoked sessions / metadata changes still apply quickly
+JWT_CACHE_MAX_TTL_SECONDS = 300
+
+
 # ============================================================================
 # JWT AUTHENTICATION (Supabase) - SIMPLIFIED!
 # ============================================================================
 
+def _jwt_cache_key(token: str) -> str:
+    """Redis key for a token (hashed - raw JWTs never leave the process)."""
+    return f"jwt:{blake2b(token.encode(), digest_size=16).hexdigest()}"
+
+
+def _get_cached_user_context(token: str) -> Optional[Dict[str, str]]:
+    """Return the cached user context for a previously validated token (None on miss)."""
+    redis_client = get_redis_optional()
+    if redis_client is None:
+        return None
+
+    try:
+        cached = redis_client.get(_jwt_cache_key(token))
+        if not cached:
+            return None
+        user_context = orjson.loads(cached)
+    except Exception as e:
+        # Redis down or a corrupt/foreign value - fall back to Supabase validation
+        logger.warning(f"JWT cache lookup failed: {e}")
+        return None
+
+    return user_context if isinstance(user_context, dict) else None
+
+
+def _cache_user_context(token: str, user_context: Dict[str, str]) -> None:
+    """Cache a validated user context until the token expires (capped at JWT_CACHE_MAX_TTL_SECONDS)."""
+    redis_client = get_redis_optional()
+    if redis_client is None:
+        return
+
+    try:
+        # Signature was just verified by Supabase - only the exp claim is read here
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        ttl = min(int(exp - time.time()), JWT_CACHE_MAX_TTL_SECONDS) if exp else JWT_CACHE_MAX_TTL_SECONDS
+        if ttl > 0:
+            redis_client.setex(_jwt_cache_key(token), ttl, orjson.dumps(user_context))
+    except Exception as e:
+        logger.warning(f"JWT cache store failed: {e}")
+
+
 async def get_current_user_context(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     supabase: Client = Depends(get_supabase)
@@ -45,6 +94,7 @@ async def get_current_user_context(
     BREAKING CHANGE: company_id is now in JWT app_metadata (no database query!)
 
     Flow:
+    0. Return the Redis-cached context if this token was validated recently
     1. Validate JWT with Supabase Auth
     2. Extract user_id from JWT sub claim
     3. Extract company_id from JWT app_metadata.company_id
@@ -81,6 +131,11 @@ async def get_current_user_context(
 
     token = credentials.credentials
 
+    # Hot path: token already validated (skips the Supabase Auth round-trip)
+    cached_context = _get_cached_user_context(token)
+    if cached_context:
+        return cached_context
+
     try:
         # Validate JWT with Supabase Auth
         response = supabase.auth.get_user(token)
@@ -112,12 +167,15 @@ async def get_current_user_context(
 
         logger.info(f"✅ User authenticated: {email} (company_id: {company_id[:8]}...)")
 
-        return {
+        user_context = {
             "user_id": user_id,
             "company_id": company_id,
             "email": email,
             "role": role
         }
+        _cache_user_context(token, user_context)
+
+        return user_context
 
     except HTTPException:
         # Re-raise HTTP exceptions (already formatted)
@@ -0,0 +1,102 @@
+"""
+Request Decompression Middleware
+Accepts gzip-compressed request bodies (Content-Encoding: gzip)
+
+Responses are compressed by Starlette's GZipMiddleware (registered in main.py);
+this is the inbound half, so clients can gzip large JSON bodies too.
+
+SECURITY:
+- Compressed and inflated size are both capped (MAX_INFLATED_BYTES) to stop
+  oversized uploads and decompression bombs
+- Truncated gzip streams are rejected, never passed on as a partial body
+"""
+import logging
+import zlib
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Largest request body we are willing to inflate (10 MB)
+MAX_INFLATED_BYTES = 10 * 1024 * 1024
+
+
+class GZipRequestMiddleware:
+    """
+    Inflate gzip request bodies before they reach the route.
+
+    Pure ASGI middleware (BaseHTTPMiddleware can't replace the request body).
+    Requests without Content-Encoding: gzip pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, max_inflated_bytes: int = MAX_INFLATED_BYTES):
+        self.app = app
+        self.max_inflated_bytes = max_inflated_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("content-encoding", "").lower() != "gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # Read the full compressed body (capped too - gzip never grows honest JSON)
+        chunks = []
+        received = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_inflated_bytes:
+                logger.warning(f"Rejected gzip request body over {self.max_inflated_bytes} bytes compressed")
+                response = JSONResponse({"detail": "Request body too large"}, status_code=413)
+                await response(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        try:
+            inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)  # gzip container
+            body = inflater.decompress(b"".join(chunks), self.max_inflated_bytes)
+        except zlib.error as e:
+            logger.warning(f"Rejected malformed gzip request body: {e}")
+            response = JSONResponse({"detail": "Malformed gzip request body"}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        if inflater.unconsumed_tail:
+            logger.warning(f"Rejected gzip request body over {self.max_inflated_bytes} bytes inflated")
+            response = JSONResponse({"detail": "Request body too large"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        if not inflater.eof:
+            logger.warning("Rejected truncated gzip request body")
+            response = JSONResponse({"detail": "Malformed gzip request body"}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        # Route sees a plain body: drop Content-Encoding, fix Content-Length
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+
+        body_sent = False
+
+        async def receive_inflated() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            # After the body, pass through (e.g. http.disconnect)
+            return await receive()
+
+        await self.app(scope, receive_inflated, send)
@@ -13,7 +13,10 @@ from .health import HealthResponse, EpisodeContextResponse
 from .ingestion import DocumentIngest, DocumentIngestResponse
 
 # Search schemas
-from .search import Message, SearchQuery, VectorResult, GraphResult, SearchResponse
+from .search import (
+    Message, SearchQuery, VectorResult, GraphResult, SearchResponse,
+    BatchSearchQuery, BatchSearchResponse
+)
 
 # Sync schemas
 from .sync import SyncResponse
@@ -34,6 +37,8 @@ __all__ = [
     "VectorResult",
     "GraphResult",
     "SearchResponse",
+    "BatchSearchQuery",
+    "BatchSearchResponse",
     # Sync
     "SyncResponse",
 ]
@@ -23,6 +23,7 @@ class SearchQuery(BaseModel):
     source_filter: Optional[str] = Field(None, description="Filter by source (gmail, slack, etc.)")
     conversation_history: Optional[List[Message]] = Field(default=[], description="Previous messages for context")
     include_full_emails: bool = Field(True, description="Auto-fetch full emails from Supabase using episode_ids")
+    text_preview_chars: Optional[int] = Field(None, description="Truncate each result's content to this many chars (None = full text)", ge=1)
 
 
 class VectorResult(BaseModel):
@@ -62,3 +63,17 @@ class SearchResponse(BaseModel):
     num_episodes: int
     message: str
     full_emails: Optional[List[Dict[str, Any]]] = Field(None, description="Full email objects from Supabase (if include_full_emails=true)")
+
+
+# Upper bound on queries per /search/batch request
+MAX_BATCH_QUERIES = 10
+
+
+class BatchSearchQuery(BaseModel):
+    """Request model for batch search: several searches in one round-trip."""
+    queries: List[SearchQuery] = Field(..., description="Searches to run", min_length=1, max_length=MAX_BATCH_QUERIES)
+
+
+class BatchSearchResponse(BaseModel):
+    """Response model for batch search (results in request order)."""
+    results: List[SearchResponse]
@@ -6,6 +6,7 @@ import os
 import logging
 import dramatiq
 from dramatiq.brokers.redis import RedisBroker
+from redis.utils import HIREDIS_AVAILABLE
 from dramatiq.middleware import (
     AgeLimit, Callbacks, Pipelines,
     Retries, ShutdownNotifications
@@ -33,6 +34,12 @@ else:
     )
     logger.info(f"✅ Redis broker initialized: {REDIS_URL[:20]}...")
 
+    # redis-py picks the hiredis C parser automatically when it is installed
+    if HIREDIS_AVAILABLE:
+        logger.info("✅ Redis reply parser: hiredis (C)")
+    else:
+        logger.warning("⚠️  hiredis not installed - Redis replies parsed in pure Python (pip install 'redis[hiredis]')")
+
 dramatiq.set_broker(redis_broker)
 broker = redis_broker
 
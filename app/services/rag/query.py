@@ -30,22 +30,10 @@ from .recency import DocumentTypeRecencyPostprocessor
 
 
 # Import dynamic company context loader
-from app.services.tenant.context import build_ceo_prompt_template
+from app.services.tenant.context import build_ceo_prompt_template, load_prompt_templates_async
 
 logger = logging.getLogger(__name__)
 
-# CEO Assistant synthesis prompt - loaded lazily on first use
-# This ensures master_supabase_client is initialized first
-_CEO_ASSISTANT_PROMPT_TEMPLATE = None
-
-def get_ceo_prompt_template():
-    """Lazy load CEO prompt from Supabase (only on first use)"""
-    global _CEO_ASSISTANT_PROMPT_TEMPLATE
-    if _CEO_ASSISTANT_PROMPT_TEMPLATE is None:
-        _CEO_ASSISTANT_PROMPT_TEMPLATE = build_ceo_prompt_template()
-    return _CEO_ASSISTANT_PROMPT_TEMPLATE
-
-
 class HybridQueryEngine:
     """
     Query engine using SubQuestionQueryEngine with vector search.
@@ -405,7 +393,9 @@ Examples:
             # Create response using retrieved nodes
             from llama_index.core.response_synthesizers import get_response_synthesizer
 
-            ceo_prompt = PromptTemplate(get_ceo_prompt_template())
+            # Refresh expired prompts without blocking the loop (builder is memoized per publish)
+            await load_prompt_templates_async()
+            ceo_prompt = PromptTemplate(build_ceo_prompt_template())
             response_synth = get_response_synthesizer(
                 llm=self.llm,
                 response_mode="compact",
@@ -476,6 +466,9 @@ Examples:
             # Re-synthesize with enhanced context
             from app.services.tenant.context import build_ceo_prompt_template
 
+            # Refresh prompt cache (if due) off the event loop before the sync builder reads it
+            await load_prompt_templates_async()
+
             context_node = TextNode(text=enhanced_context)
             context_node_with_score = NodeWithScore(node=context_node, score=1.0)
 
@@ -646,6 +639,7 @@ Examples:
                 context_node_with_score = NodeWithScore(node=context_node, score=1.0)
 
                 from app.services.tenant.context import build_ceo_prompt_template as get_ceo_prompt
+                await load_prompt_templates_async()
                 ceo_prompt = PromptTemplate(get_ceo_prompt())
                 synthesizer = get_response_synthesizer(
                     llm=self.llm,
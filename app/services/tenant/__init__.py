@@ -5,8 +5,16 @@ Multi-tenant company information and prompt templates
 from app.services.tenant.context import (
     load_company_context,
     get_company_context,
+    get_company_context_async,
     load_prompt_templates,
+    load_prompt_templates_async,
     get_prompt_template,
+    get_prompt_template_async,
+    invalidate_company_context,
+    invalidate_prompt_templates,
+    invalidate_all,
+    publish_invalidation,
+    reload_caches,
     render_prompt_template,
     build_ceo_prompt_template,
     build_email_classification_context,
@@ -22,8 +30,16 @@ from app.services.tenant.context import (
 __all__ = [
     "load_company_context",
     "get_company_context",
+    "get_company_context_async",
     "load_prompt_templates",
+    "load_prompt_templates_async",
     "get_prompt_template",
+    "get_prompt_template_async",
+    "invalidate_company_context",
+    "invalidate_prompt_templates",
+    "invalidate_all",
+    "publish_invalidation",
+    "reload_caches",
     "render_prompt_template",
     "build_ceo_prompt_template",
     "build_email_classification_context",
@@ -10,26 +10,381 @@ This makes EVERYTHING dynamic:
 
 Each company can customize both their data AND their prompts!
 """
+import asyncio
+import functools
+import importlib.resources
+import itertools
 import logging
-from typing import Dict, List, Optional
+import os
+import re
+import stat
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+import httpx
+import orjson
 from app.core.config import settings as master_config
 
 logger = logging.getLogger(__name__)
 
+# Settings read on every load - bound once at import (settings don't change at runtime)
+_IS_MULTI_TENANT: bool = master_config.is_multi_tenant
+_COMPANY_ID: Optional[str] = master_config.company_id
+
+
+# Cached master Supabase client (resolved once it has been initialized)
+_master_client = None
+
 
 def _get_master_client():
-    """Get master_supabase_client dynamically to avoid import-time None capture."""
-    from app.core.dependencies import master_supabase_client
-    return master_supabase_client
+    """
+    Get master_supabase_client dynamically to avoid import-time None capture.
+
+    Once initialized, the shared client is cached here so later lookups skip the import.
+    """
+    global _master_client
+
+    if _master_client is None:
+        from app.core.dependencies import master_supabase_client
+        _master_client = master_supabase_client
+
+    return _master_client
+
+# Global cache for company context (read-only mapping; reloads rebind it, never mutate it)
+_company_context_cache: Optional[Mapping[str, Any]] = None
+
+
+class _PromptSnapshot(NamedTuple):
+    """
+    Everything derived from one prompt load, published as a single object.
+
+    Reloads build a new snapshot and rebind _prompt_snapshot, so readers on any
+    thread see one consistent set of templates and render functions.
+    """
+    templates: Dict[str, str]
+    renderers: Mapping[str, Callable[[Mapping[str, Any]], str]]  # Compiled per prompt_key
+    expires_at: float  # time.monotonic() deadline, see PROMPT_TEMPLATES_TTL_SECONDS
+    # Templates for the well-known keys (None if the company has no such prompt)
+    ceo: Optional[str]
+    email: Optional[str]
+    vision_extract: Optional[str]
+    vision_business_check: Optional[str]
+    # Memoized builder results for THIS snapshot: name → (context built from, result)
+    memo: Dict[str, Tuple[Mapping[str, Any], str]]
+
+
+# Global cache for prompt templates (refetched after PROMPT_TEMPLATES_TTL_SECONDS)
+_prompt_snapshot: Optional[_PromptSnapshot] = None
+
+# How often the lifespan refresh task re-reads company context + prompts (see refresh_caches_periodically)
+CONTEXT_REFRESH_INTERVAL_SECONDS = 150
+
+# How long loaded prompts are served before refetching (picks up edits in Supabase).
+# Twice the refresh interval, so on the API the refresh task always lands before expiry.
+PROMPT_TEMPLATES_TTL_SECONDS = 2 * CONTEXT_REFRESH_INTERVAL_SECONDS
+
+# After a failed load, serve the fallback for this long before hitting Supabase again
+PROMPT_TEMPLATES_RETRY_SECONDS = 60
+
+# Last bootstrap payload persisted locally so restarts can serve before Supabase answers.
+# Kept in a per-user 0700 directory (its contents end up in prompts - see _disk_cache_dir)
+DISK_CACHE_MAX_AGE_SECONDS = 300
+_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), f"highforce-{os.getuid()}")
+_DISK_CACHE_PATH = os.path.join(_DISK_CACHE_DIR, f"ctx_{_COMPANY_ID}.json")
+
+# Background Supabase refresh (after a disk restore, or when the loop finds prompts
+# expired - see _schedule_background_refresh); kept referenced until done
+_refresh_task: Optional["asyncio.Task[None]"] = None
+
+# {{var}} placeholder in prompt templates
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# {{var}} placeholder after escaping literal braces for str.format_map (see _compile_template)
+_ESCAPED_PLACEHOLDER_RE = re.compile(r"\{\{\{\{([A-Za-z_]\w*)\}\}\}\}")
+
+# Serialize async cache fills so concurrent requests share one Supabase fetch
+_context_load_lock = asyncio.Lock()
+_prompts_load_lock = asyncio.Lock()
+
+# Guard cache publishes and resets (invalidation can come from any request thread)
+_context_lock = threading.Lock()
+_prompts_lock = threading.Lock()
+
+# Bumped by every invalidation. Loads capture it before fetching and publish only if it
+# is unchanged, so a load already in flight can't put pre-invalidation data back.
+_generation_counter = itertools.count(1)
+_cache_generation: int = 0
+
+# Redis pub/sub channel that fans invalidations out to every API and worker process
+_INVALIDATION_CHANNEL = f"tenant:cache_invalidated:{_COMPANY_ID}"
+
+# Identifies this process on the channel (it already applied its own invalidations)
+_INSTANCE_ID = uuid.uuid4().hex
+
+# Pause before resubscribing after the invalidation listener loses Redis
+# (doubles on each consecutive failure, up to the max - Redis is optional)
+INVALIDATION_RECONNECT_SECONDS = 5
+INVALIDATION_RECONNECT_MAX_SECONDS = 300
+
+# Single-flight sync reloads (dramatiq threads, asyncio.to_thread loaders):
+# one thread hits Supabase, the rest wait on a cold cache or serve the stale one
+_context_reload_lock = threading.Lock()
+_prompts_reload_lock = threading.Lock()
+
+# Well-known prompt keys (interned so cache lookups hit the identity fast path)
+PROMPT_KEY_CEO = sys.intern("ceo_assistant")
+PROMPT_KEY_EMAIL = sys.intern("email_classifier")
+PROMPT_KEY_VISION_EXTRACT = sys.intern("vision_ocr_extract")
+PROMPT_KEY_VISION_BUSINESS_CHECK = sys.intern("vision_ocr_business_check")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fallback(name: str) -> str:
+    """
+    Load a fallback prompt from app/services/tenant/fallbacks/{name}.txt.
+
+    Only read on the fallback path (prompt missing from Supabase), so the
+    multi-KB prompt bodies aren't held in memory by every worker at import.
+    """
+    resource = importlib.resources.files(__package__).joinpath(f"fallbacks/{name}.txt")
+    return resource.read_text(encoding="utf-8").rstrip("\n")
+
+
+def _freeze_context(context: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Freeze a context dict so it can be shared across threads without copying.
+
+    Lists become tuples, team member dicts become read-only views and
+    top-level string fields are interned.
+    Also precomputes the derived fields used by the vision OCR prompts:
+        - description_short_150: Description truncated to 150 chars
+        - capabilities_top3: First 3 capabilities
+        - vision_short_desc: Ready-made company blurb for build_vision_ocr_context()
+    """
+    frozen = {key: sys.intern(value) if type(value) is str else value for key, value in context.items()}
+    frozen["industries"] = tuple(context.get("industries") or ())
+    frozen["capabilities"] = tuple(context.get("capabilities") or ())
+    frozen["team"] = tuple(MappingProxyType(dict(member)) for member in context.get("team") or ())
+    frozen["description"] = context.get("description") or ""
+    frozen["description_short_150"] = frozen["description"][:150]  # Keep it short for prompts
+    frozen["capabilities_top3"] = frozen["capabilities"][:3]
+
+    desc = frozen["description_short_150"] or frozen.get("name")
+    if frozen["capabilities_top3"]:
+        frozen["vision_short_desc"] = f"{frozen.get('name')} ({desc} - {', '.join(frozen['capabilities_top3'])})"
+    else:
+        frozen["vision_short_desc"] = f"{frozen.get('name')} ({desc})"
+
+    return MappingProxyType(frozen)
+
+
+# Default context when not multi-tenant or loading fails (frozen once, shared)
+_DEFAULT_CONTEXT: Mapping[str, Any] = _freeze_context({
+    "name": "Your Company",
+    "slug": "default",
+    "description": "A business",
+    "location": "Unknown",
+    "industries": [],
+    "capabilities": [],
+    "team": [],
+    "contact_name": "",
+    "contact_email": ""
+})
+
+
+def _set_company_context_cache(context: Mapping[str, Any], generation: Optional[int] = None) -> Mapping[str, Any]:
+    """
+    Publish a context (one global rebind - the frozen mapping is never mutated).
+
+    Loads pass the _cache_generation they started under; if an invalidation has
+    happened since, the context is returned to the caller but not published.
+    """
+    global _company_context_cache
+
+    with _context_lock:
+        if generation is not None and generation != _cache_generation:
+            logger.debug("Discarding company context loaded before the last invalidation")
+            return context
+        _company_context_cache = context
+    return context
 
-# Global cache for company context (loaded once at startup)
-_company_context_cache: Optional[Dict] = None
 
-# Global cache for prompt templates (loaded once at startup)
-_prompt_templates_cache: Optional[Dict[str, str]] = None
+def _build_company_context(company: Dict[str, Any], team: List[Dict[str, Any]]) -> Mapping[str, Any]:
+    """Build the frozen company context from a companies row and its team rows."""
+    return _freeze_context({
+        "name": company.get("name", "Your Company"),
+        "slug": company.get("slug", "default"),
+        "description": company.get("company_description", ""),
+        "location": company.get("company_location", ""),
+        "industries": company.get("industries_served", []),
+        "capabilities": company.get("key_capabilities", []),
+        "team": team,
+        "contact_name": company.get("primary_contact_name", ""),
+        "contact_email": company.get("primary_contact_email", "")
+    })
 
 
-def load_company_context() -> Dict:
+# Extracts (prompt_key, prompt_template) from a company_prompts row
+_PROMPT_ROW = itemgetter("prompt_key", "prompt_template")
+
+
+def _build_prompt_map(rows: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Build the prompt_key → prompt_template map from company_prompts rows.
+
+    Keys and bodies are interned so repeated reloads (and identical bodies
+    under different keys) share one string object.
+    """
+    return {
+        sys.intern(key): sys.intern(template) if template else template
+        for key, template in map(_PROMPT_ROW, rows)
+    }
+
+
+def _load_bootstrap(generation: int) -> Optional[Tuple[Mapping[str, Any], _PromptSnapshot]]:
+    """
+    Load company context AND prompt templates in a single round-trip.
+
+    Calls the get_company_bootstrap(cid) RPC (migrations/company_bootstrap_rpc.sql)
+    which returns the company row, active team members and active prompts as one
+    JSON payload, and fills both caches from it.
+
+    Returns:
+        (context, prompt snapshot) if loaded, None if the caller should fall back
+        to per-table queries (RPC not deployed, company missing, etc.)
+    """
+    master_client = _get_master_client()
+    if not master_client:
+        return None
+
+    try:
+        result = master_client.rpc("get_company_bootstrap", {"cid": _COMPANY_ID}).execute()
+    except Exception as e:
+        logger.warning("⚠️  Company bootstrap RPC failed, falling back to per-table queries: %s", e)
+        return None
+
+    return _apply_bootstrap(result.data, generation=generation)
+
+
+def _apply_bootstrap(
+    data: Optional[Dict[str, Any]],
+    persist: bool = True,
+    generation: Optional[int] = None
+) -> Optional[Tuple[Mapping[str, Any], _PromptSnapshot]]:
+    """
+    Fill both caches from a get_company_bootstrap payload (None if company missing).
+
+    Payloads fetched from Supabase are also written to the disk cache (persist=True)
+    so the next process start can restore them without a round-trip.
+    """
+    data = data or {}
+    company = data.get("company")
+    if not company:
+        return None
+
+    if persist:
+        _save_disk_cache(data)
+
+    context = _set_company_context_cache(_build_company_context(company, data.get("team") or []), generation)
+    snapshot = _set_prompt_templates_cache(_build_prompt_map(data.get("prompts") or []), generation=generation)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ Loaded company bootstrap for: %s", context["name"])
+        logger.info("   📍 Location: %s", context["location"])
+        logger.info("   👥 Team members: %d", len(context["team"]))
+        logger.info("   🏭 Industries: %d", len(context["industries"]))
+        logger.info("   📝 Prompt templates: %s", ", ".join(snapshot.templates))
+
+    return context, snapshot
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """True if a disk cache path is owned by this user and inaccessible to group/other."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _disk_cache_dir() -> Optional[str]:
+    """
+    Create (or verify) the disk cache directory.
+
+    Returns None if the path exists but is not a private (0700, owned by us)
+    directory - anything else could have been planted by another local user.
+    """
+    try:
+        os.mkdir(_DISK_CACHE_DIR, 0o700)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.warning("⚠️  Could not create company context disk cache dir: %s", e)
+        return None
+
+    st = os.lstat(_DISK_CACHE_DIR)
+    if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+        logger.warning("⚠️  Ignoring company context disk cache: %s is not a private directory", _DISK_CACHE_DIR)
+        return None
+
+    return _DISK_CACHE_DIR
+
+
+def _save_disk_cache(data: Dict[str, Any]) -> None:
+    """Write the bootstrap payload to the disk cache (0600, atomic replace, best effort)."""
+    if _disk_cache_dir() is None:
+        return
+
+    tmp_path = f"{_DISK_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data, default=str))
+        os.replace(tmp_path, _DISK_CACHE_PATH)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("⚠️  Could not write company context disk cache: %s", e)
+
+
+def _restore_disk_cache() -> bool:
+    """
+    Fill both caches from the disk cache if it is younger than DISK_CACHE_MAX_AGE_SECONDS.
+
+    Only snapshots in our private cache dir, owned by us with mode 0600, are trusted.
+
+    Returns:
+        True if the caches were restored, False if there is no usable snapshot
+    """
+    if not _IS_MULTI_TENANT or not _COMPANY_ID or _disk_cache_dir() is None:
+        return False
+
+    generation = _cache_generation
+
+    try:
+        fd = os.open(_DISK_CACHE_PATH, os.O_RDONLY | os.O_NOFOLLOW)
+        with os.fdopen(fd, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not _is_private(st):
+                logger.warning("⚠️  Ignoring company context disk cache with unsafe owner/mode")
+                return False
+            age = time.time() - st.st_mtime
+            if age >= DISK_CACHE_MAX_AGE_SECONDS:
+                return False
+            data = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return False
+
+    if not isinstance(data, dict) or not isinstance(data.get("company"), dict):
+        return False
+
+    if not _apply_bootstrap(data, persist=False, generation=generation):
+        return False
+
+    logger.info("💾 Restored company context from disk cache (%.0fs old)", age)
+    return True
+
+
+def load_company_context() -> Mapping[str, Any]:
     """
     Load company information from master Supabase.
 
@@ -38,164 +393,425 @@ def load_company_context() -> Dict:
         - slug: Company slug
         - description: Company description
         - location: Company location
-        - industries: List of industries served
-        - capabilities: List of key capabilities
-        - team: List of team members with name, title, role_description, reports_to
+        - industries: Tuple of industries served
+        - capabilities: Tuple of key capabilities
+        - team: Tuple of team members with name, title, role_description, reports_to
         - contact_name: Primary contact name
         - contact_email: Primary contact email
 
+    The returned mapping is read-only (shared by all callers, never copy it).
     If not in multi-tenant mode, returns default/empty context.
     """
-    global _company_context_cache
-
     # Return cached context if already loaded
-    if _company_context_cache is not None:
-        return _company_context_cache
+    context = _company_context_cache
+    if context is not None:
+        return context
 
+    # Cold cache: one thread loads, concurrent callers wait for its result
+    with _context_reload_lock:
+        if _company_context_cache is not None:
+            return _company_context_cache
+        return _reload_company_context()
+
+
+def _reload_company_context() -> Mapping[str, Any]:
+    """Fetch company context from Supabase and publish it (caller holds _context_reload_lock)."""
     # Check if multi-tenant mode is enabled
-    if not master_config.is_multi_tenant:
+    if not _IS_MULTI_TENANT:
         logger.info("📋 Single-tenant mode - no dynamic company context")
-        _company_context_cache = {
-            "name": "Your Company",
-            "slug": "default",
-            "description": "A business",
-            "location": "Unknown",
-            "industries": [],
-            "capabilities": [],
-            "team": [],
-            "contact_name": "",
-            "contact_email": ""
-        }
-        return _company_context_cache
+        return _set_company_context_cache(_DEFAULT_CONTEXT)
+
+    if not _COMPANY_ID:
+        logger.error("❌ No company_id configured - using default company context")
+        return _set_company_context_cache(_DEFAULT_CONTEXT)
+
+    generation = _cache_generation
 
     try:
         # Load company info from master Supabase
-        logger.info(f"🔍 Loading company context for company_id: {master_config.company_id}")
+        logger.info("🔍 Loading company context for company_id: %s", _COMPANY_ID)
+
+        # Fast path: company + team + prompts in one round-trip
+        loaded = _load_bootstrap(generation)
+        if loaded:
+            return loaded[0]
 
         master_client = _get_master_client()
         if not master_client:
             logger.error("❌ Master Supabase client not initialized")
-            _company_context_cache = _get_default_context()
-            return _company_context_cache
+            return _set_company_context_cache(_DEFAULT_CONTEXT)
 
         company_result = master_client.table("companies")\
             .select("*")\
-            .eq("id", master_config.company_id)\
+            .eq("id", _COMPANY_ID)\
             .single()\
             .execute()
 
         if not company_result.data:
-            logger.error(f"❌ Company not found in master Supabase: {master_config.company_id}")
-            _company_context_cache = _get_default_context()
-            return _company_context_cache
+            logger.error("❌ Company not found in master Supabase: %s", _COMPANY_ID)
+            return _set_company_context_cache(_DEFAULT_CONTEXT)
 
         company = company_result.data
 
         # Load team members from master Supabase
         team_result = master_client.table("company_team_members")\
             .select("*")\
-            .eq("company_id", master_config.company_id)\
+            .eq("company_id", _COMPANY_ID)\
             .eq("is_active", True)\
             .execute()
 
         team = team_result.data or []
 
         # Build context
-        _company_context_cache = {
-            "name": company.get("name", "Your Company"),
-            "slug": company.get("slug", "default"),
-            "description": company.get("company_description", ""),
-            "location": company.get("company_location", ""),
-            "industries": company.get("industries_served", []),
-            "capabilities": company.get("key_capabilities", []),
-            "team": team,
-            "contact_name": company.get("primary_contact_name", ""),
-            "contact_email": company.get("primary_contact_email", "")
-        }
-
-        logger.info(f"✅ Loaded company context for: {_company_context_cache['name']}")
-        logger.info(f"   📍 Location: {_company_context_cache['location']}")
-        logger.info(f"   👥 Team members: {len(_company_context_cache['team'])}")
-        logger.info(f"   🏭 Industries: {len(_company_context_cache['industries'])}")
+        context = _set_company_context_cache(_build_company_context(company, team), generation)
 
-        return _company_context_cache
-
-    except Exception as e:
-        logger.error(f"❌ Failed to load company context: {e}")
-        _company_context_cache = _get_default_context()
-        return _company_context_cache
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Loaded company context for: %s", context["name"])
+            logger.info("   📍 Location: %s", context["location"])
+            logger.info("   👥 Team members: %d", len(context["team"]))
+            logger.info("   🏭 Industries: %d", len(context["industries"]))
 
+        return context
 
-def _get_default_context() -> Dict:
-    """Return default context when loading fails."""
-    return {
-        "name": "Your Company",
-        "slug": "default",
-        "description": "A business",
-        "location": "Unknown",
-        "industries": [],
-        "capabilities": [],
-        "team": [],
-        "contact_name": "",
-        "contact_email": ""
-    }
+    except Exception as e:
+        logger.error("❌ Failed to load company context: %s", e)
+        return _set_company_context_cache(_DEFAULT_CONTEXT)
 
 
-def get_company_context() -> Dict:
+def get_company_context() -> Mapping[str, Any]:
     """
     Get cached company context (loads if not already loaded).
 
     Use this function in all services that need company information.
+    Returns a read-only view - do not mutate it.
     """
     return load_company_context()
 
 
+def _set_prompt_snapshot(snapshot: _PromptSnapshot, generation: Optional[int] = None) -> _PromptSnapshot:
+    """
+    Publish a prompt snapshot (one global rebind - never mutated in place).
+
+    Snapshots loaded before the last invalidation are returned but not published
+    (see _set_company_context_cache).
+    """
+    global _prompt_snapshot
+
+    with _prompts_lock:
+        if generation is not None and generation != _cache_generation:
+            logger.debug("Discarding prompt templates loaded before the last invalidation")
+            return snapshot
+        _prompt_snapshot = snapshot
+    return snapshot
+
+
+def _set_prompt_templates_cache(
+    prompts: Dict[str, str],
+    ttl: float = PROMPT_TEMPLATES_TTL_SECONDS,
+    generation: Optional[int] = None
+) -> _PromptSnapshot:
+    """Compile prompts into a new snapshot (with TTL) and publish it."""
+    return _set_prompt_snapshot(_PromptSnapshot(
+        templates=prompts,
+        renderers=MappingProxyType({key: _compile_template(template, key) for key, template in prompts.items() if template}),
+        expires_at=time.monotonic() + ttl,
+        ceo=prompts.get(PROMPT_KEY_CEO),
+        email=prompts.get(PROMPT_KEY_EMAIL),
+        vision_extract=prompts.get(PROMPT_KEY_VISION_EXTRACT),
+        vision_business_check=prompts.get(PROMPT_KEY_VISION_BUSINESS_CHECK),
+        memo={}
+    ), generation)
+
+
+# ============================================================================
+# ASYNC LOADING (direct PostgREST over a pooled httpx.AsyncClient)
+# ============================================================================
+
+# Async PostgREST client for cache loads (created on first use, see _get_pg_client)
+_pg_client: Optional[httpx.AsyncClient] = None
+
+# Prebuilt PostgREST query params for the cache loads (company_id is fixed per process)
+_PG_COMPANY_PARAMS = {"select": "*", "id": f"eq.{_COMPANY_ID}"}
+_PG_TEAM_PARAMS = {"select": "*", "company_id": f"eq.{_COMPANY_ID}", "is_active": "eq.true"}
+_PG_PROMPTS_PARAMS = {"select": "prompt_key,prompt_template", "company_id": f"eq.{_COMPANY_ID}", "is_active": "eq.true"}
+
+
+def _get_pg_client() -> httpx.AsyncClient:
+    """Get the shared async PostgREST client (service role, keep-alive pool)."""
+    global _pg_client
+
+    if _pg_client is None:
+        service_key = master_config.supabase_service_key
+        _pg_client = httpx.AsyncClient(
+            base_url=f"{master_config.supabase_url}/rest/v1",
+            headers={"apikey": service_key, "Authorization": f"Bearer {service_key}"},
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+        )
+
+    return _pg_client
+
+
+async def close_pg_client() -> None:
+    """Close the async PostgREST client (called on app shutdown)."""
+    global _pg_client
+
+    if _pg_client is not None:
+        await _pg_client.aclose()
+        _pg_client = None
+
+
+async def _pg_get(path: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+    """GET rows from a PostgREST table."""
+    response = await _get_pg_client().get(path, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def _pg_rpc(function: str, payload: Dict[str, Any]) -> Any:
+    """Call a Postgres function through PostgREST."""
+    response = await _get_pg_client().post(
+        f"/rpc/{function}",
+        content=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"}
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def _load_all_async() -> bool:
+    """
+    Fill both caches without blocking the event loop.
+
+    Tries the get_company_bootstrap RPC first (one round-trip), then falls back
+    to the three table queries issued concurrently.
+
+    Returns:
+        True if both caches were filled, False otherwise
+    """
+    generation = _cache_generation
+
+    try:
+        if _apply_bootstrap(await _pg_rpc("get_company_bootstrap", {"cid": _COMPANY_ID}), generation=generation):
+            return True
+    except Exception as e:
+        logger.warning("⚠️  Company bootstrap RPC failed, falling back to per-table queries: %s", e)
+
+    companies, team, prompt_rows = await asyncio.gather(
+        _pg_get("/companies", _PG_COMPANY_PARAMS),
+        _pg_get("/company_team_members", _PG_TEAM_PARAMS),
+        _pg_get("/company_prompts", _PG_PROMPTS_PARAMS)
+    )
+
+    if not companies:
+        logger.error("❌ Company not found in master Supabase: %s", _COMPANY_ID)
+        return False
+
+    return _apply_bootstrap({"company": companies[0], "team": team, "prompts": prompt_rows}, generation=generation) is not None
+
+
+async def _refresh_caches_async() -> None:
+    """Fill both caches over async HTTP, falling back to the sync loaders in a worker thread."""
+    if _IS_MULTI_TENANT and _COMPANY_ID:
+        try:
+            if await _load_all_async():
+                return
+        except Exception as e:
+            logger.error("❌ Async company context load failed: %s", e)
+
+    # Single-tenant / missing config / async failure: sync loaders handle defaults
+    await asyncio.to_thread(load_company_context)
+    await asyncio.to_thread(load_prompt_templates)
+
+
+async def warm_caches() -> None:
+    """
+    Warm company context + prompt caches at API startup.
+
+    If a fresh disk snapshot can be restored, return immediately and refresh from
+    Supabase in the background; otherwise load them now (one bootstrap round-trip
+    fills both; the prompt load is then a cache hit).
+    """
+    global _refresh_task
+
+    if _restore_disk_cache():
+        _refresh_task = asyncio.create_task(_refresh_caches_async())
+        return
+
+    await get_company_context_async()
+    await load_prompt_templates_async()
+
+
+async def refresh_caches_periodically(interval: float = CONTEXT_REFRESH_INTERVAL_SECONDS) -> None:
+    """
+    Reload company context + prompts every `interval` seconds (run as a lifespan task).
+
+    Each successful load publishes a new context mapping and a new prompt snapshot
+    (one global rebind each), so readers never block and admin edits in Supabase
+    propagate without a restart. The interval is half PROMPT_TEMPLATES_TTL_SECONDS,
+    so callers never find the prompts expired while the refresh is healthy.
+    Failed loads keep serving the current caches until the next attempt.
+    """
+    if not _IS_MULTI_TENANT or not _COMPANY_ID:
+        return
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await _load_all_async():
+                logger.warning("⚠️  Periodic company context refresh returned no company - keeping current caches")
+        except Exception as e:
+            logger.error("❌ Periodic company context refresh failed: %s", e)
+
+
+async def get_company_context_async() -> Mapping[str, Any]:
+    """
+    Async variant of get_company_context() for request handlers.
+
+    On a cache miss the Supabase fetch runs over async HTTP so the event loop
+    stays free while waiting on the network.
+    """
+    if _company_context_cache is not None:
+        return _company_context_cache
+
+    async with _context_load_lock:
+        if _company_context_cache is None:
+            await _refresh_caches_async()
+        return load_company_context()
+
+
 def load_prompt_templates() -> Dict[str, str]:
     """
     Load all prompt templates from master Supabase.
 
     Returns dict mapping prompt_key → prompt_template text.
-    Loads once and caches in memory.
+    Caches in memory for PROMPT_TEMPLATES_TTL_SECONDS, then refetches all of
+    the company's prompts in one query so edits propagate without a restart.
+    A failed load is cached for PROMPT_TEMPLATES_RETRY_SECONDS so an outage
+    doesn't turn every caller into a Supabase retry.
+    """
+    return _get_prompt_snapshot().templates
+
+
+def _get_prompt_snapshot() -> _PromptSnapshot:
     """
-    global _prompt_templates_cache
+    Current prompt snapshot, reloaded first if missing or expired (see load_prompt_templates).
 
-    # Return cached prompts if already loaded
-    if _prompt_templates_cache is not None:
-        return _prompt_templates_cache
+    Expired prompts are reloaded by ONE thread while every other caller keeps
+    serving the stale snapshot. On the event loop the reload is handed to a
+    background task instead, so sync helpers never block a request on Supabase.
+    """
+    # Return cached prompts if loaded and not expired
+    snapshot = _prompt_snapshot
+    if snapshot is not None and time.monotonic() < snapshot.expires_at:
+        return snapshot
+
+    if snapshot is not None:
+        if _schedule_background_refresh() or not _prompts_reload_lock.acquire(blocking=False):
+            return snapshot
+    else:
+        # Nothing to serve yet - wait for whoever is loading (or load it ourselves)
+        _prompts_reload_lock.acquire()
+
+    try:
+        # Another thread may have reloaded while we waited for the lock
+        snapshot = _prompt_snapshot
+        if snapshot is not None and time.monotonic() < snapshot.expires_at:
+            return snapshot
+        return _reload_prompt_snapshot(snapshot)
+    finally:
+        _prompts_reload_lock.release()
 
+
+def _schedule_background_refresh() -> bool:
+    """
+    If called on the event loop thread, start an async cache refresh (one at a time).
+
+    Returns:
+        True if the refresh was handed to the event loop, False when called from
+        a worker thread (which should reload synchronously)
+    """
+    global _refresh_task
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = loop.create_task(_refresh_caches_async())
+    return True
+
+
+def _reload_prompt_snapshot(snapshot: Optional[_PromptSnapshot]) -> _PromptSnapshot:
+    """Fetch prompts from Supabase and publish them (caller holds _prompts_reload_lock)."""
     # Check if multi-tenant mode is enabled
-    if not master_config.is_multi_tenant:
+    if not _IS_MULTI_TENANT:
         logger.info("📋 Single-tenant mode - using default prompts (not from database)")
-        _prompt_templates_cache = {}
-        return _prompt_templates_cache
+        return _set_prompt_templates_cache({})
+
+    if not _COMPANY_ID:
+        logger.error("❌ No company_id configured - using default prompts")
+        return _set_prompt_templates_cache({})
+
+    generation = _cache_generation
 
     try:
-        logger.info(f"🔍 Loading prompt templates for company_id: {master_config.company_id}")
+        logger.info("🔍 Loading prompt templates for company_id: %s", _COMPANY_ID)
+
+        # Fast path: company + team + prompts in one round-trip
+        loaded = _load_bootstrap(generation)
+        if loaded:
+            return loaded[1]
 
         master_client = _get_master_client()
         if not master_client:
             logger.error("❌ Master Supabase client not initialized")
-            _prompt_templates_cache = {}
-            return _prompt_templates_cache
+            return _set_prompt_templates_cache({}, ttl=PROMPT_TEMPLATES_RETRY_SECONDS, generation=generation)
 
         result = master_client.table("company_prompts")\
             .select("prompt_key, prompt_template")\
-            .eq("company_id", master_config.company_id)\
+            .eq("company_id", _COMPANY_ID)\
             .eq("is_active", True)\
             .execute()
 
-        prompts = {row["prompt_key"]: row["prompt_template"] for row in result.data}
+        prompts = _build_prompt_map(result.data)
 
-        _prompt_templates_cache = prompts
+        snapshot = _set_prompt_templates_cache(prompts, generation=generation)
 
-        logger.info(f"✅ Loaded {len(prompts)} prompt templates: {list(prompts.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Loaded %d prompt templates: %s", len(prompts), ", ".join(prompts))
 
-        return _prompt_templates_cache
+        return snapshot
 
     except Exception as e:
-        logger.error(f"❌ Failed to load prompt templates: {e}")
-        _prompt_templates_cache = {}
-        return _prompt_templates_cache
+        logger.error("❌ Failed to load prompt templates: %s", e)
+        if snapshot is not None and snapshot.templates:
+            # Keep serving the previously loaded prompts rather than falling back
+            logger.warning("⚠️  Keeping %d previously loaded prompt templates", len(snapshot.templates))
+            return _set_prompt_snapshot(
+                snapshot._replace(expires_at=time.monotonic() + PROMPT_TEMPLATES_RETRY_SECONDS), generation
+            )
+        # Negative cache: don't retry Supabase on every call during an outage
+        return _set_prompt_templates_cache({}, ttl=PROMPT_TEMPLATES_RETRY_SECONDS, generation=generation)
+
+
+async def load_prompt_templates_async() -> Dict[str, str]:
+    """
+    Async variant of load_prompt_templates() for request handlers.
+
+    Cache hits return immediately; misses and TTL refreshes fetch over async
+    HTTP instead of blocking the event loop.
+    """
+    snapshot = _prompt_snapshot
+    if snapshot is not None and time.monotonic() < snapshot.expires_at:
+        return snapshot.templates
+
+    async with _prompts_load_lock:
+        snapshot = _prompt_snapshot
+        if snapshot is None or time.monotonic() >= snapshot.expires_at:
+            await _refresh_caches_async()
+        return _get_prompt_snapshot().templates
 
 
 def get_prompt_template(prompt_key: str, default: Optional[str] = None) -> Optional[str]:
@@ -209,10 +825,210 @@ def get_prompt_template(prompt_key: str, default: Optional[str] = None) -> Optio
     Returns:
         Prompt template string, or None if not found
     """
-    prompts = load_prompt_templates()
+    # One dict lookup on the current snapshot (reloaded first if expired)
+    template = _get_prompt_snapshot().templates.get(prompt_key)
+    return default if template is None else template
+
+
+async def get_prompt_template_async(prompt_key: str, default: Optional[str] = None) -> Optional[str]:
+    """Async variant of get_prompt_template() (see load_prompt_templates_async)."""
+    prompts = await load_prompt_templates_async()
     return prompts.get(prompt_key, default)
 
 
+def invalidate_company_context() -> None:
+    """Drop the cached company context so the next access reloads it from Supabase (this process)."""
+    global _company_context_cache, _cache_generation
+
+    with _context_lock:
+        _cache_generation = next(_generation_counter)
+        _company_context_cache = None
+
+
+def invalidate_prompt_templates() -> None:
+    """Drop the cached prompt templates so the next access reloads them from Supabase (this process)."""
+    global _prompt_snapshot, _cache_generation
+
+    with _prompts_lock:
+        _cache_generation = next(_generation_counter)
+        _prompt_snapshot = None
+
+
+def invalidate_all() -> None:
+    """
+    Drop all cached company context and prompt templates in this process.
+
+    Used by dramatiq workers (see start_invalidation_listener), whose threads
+    reload on their next access. The API uses reload_caches() instead, so no
+    reader on the event loop ever finds a cold cache.
+    """
+    invalidate_company_context()
+    invalidate_prompt_templates()
+    logger.info("🔄 Company context and prompt template caches invalidated")
+
+
+def _advance_generation() -> None:
+    """Bump _cache_generation so loads already in flight can't publish what they fetched."""
+    global _cache_generation
+
+    with _context_lock, _prompts_lock:
+        _cache_generation = next(_generation_counter)
+
+
+async def reload_caches() -> None:
+    """
+    Replace company context + prompts with a fresh load (API side of an invalidation).
+
+    The generation is bumped first so in-flight loads can't publish pre-invalidation
+    data; readers keep the current caches until the new ones are published. If the
+    reload fails, the prompts are marked expired so the next access retries in the
+    background (the context is retried by refresh_caches_periodically).
+    """
+    global _prompt_snapshot
+
+    _advance_generation()
+    try:
+        if _IS_MULTI_TENANT and _COMPANY_ID and await _load_all_async():
+            logger.info("🔄 Company context and prompt template caches reloaded")
+            return
+    except Exception as e:
+        logger.error("❌ Company context reload after invalidation failed: %s", e)
+
+    with _prompts_lock:
+        if _prompt_snapshot is not None:
+            _prompt_snapshot = _prompt_snapshot._replace(expires_at=0.0)
+
+
+def publish_invalidation() -> None:
+    """Tell every other API and worker process to drop its caches (Redis pub/sub, best effort)."""
+    from app.core.dependencies import get_redis_optional
+
+    redis_client = get_redis_optional()
+    if redis_client is None:
+        logger.warning("⚠️  Redis not available - cache invalidation applied to this process only")
+        return
+
+    try:
+        redis_client.publish(_INVALIDATION_CHANNEL, _INSTANCE_ID)
+    except Exception as e:
+        logger.warning("⚠️  Failed to publish cache invalidation: %s", e)
+
+
+async def listen_for_invalidations() -> None:
+    """
+    Apply invalidations published by other processes (run as an API lifespan task).
+
+    Each message reloads this process's caches over async HTTP (reload_caches), so
+    request handlers never fall back to a blocking fetch. Messages missed while
+    Redis is unreachable are covered by refresh_caches_periodically().
+
+    Skipped when Redis wasn't available at startup (it is optional for local dev);
+    connection errors back off up to INVALIDATION_RECONNECT_MAX_SECONDS.
+    """
+    import redis.asyncio as aioredis
+    from app.core.dependencies import get_redis_optional
+
+    if get_redis_optional() is None:
+        logger.info("ℹ️  Redis not available - cross-process cache invalidation disabled")
+        return
+
+    delay = INVALIDATION_RECONNECT_SECONDS
+    while True:
+        client = None
+        try:
+            client = aioredis.from_url(master_config.redis_url, decode_responses=True)
+            async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(_INVALIDATION_CHANNEL)
+                delay = INVALIDATION_RECONNECT_SECONDS
+                async for message in pubsub.listen():
+                    if message["data"] != _INSTANCE_ID:
+                        await reload_caches()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _log_listener_failure(e, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, INVALIDATION_RECONNECT_MAX_SECONDS)
+        finally:
+            if client is not None:
+                await client.close()
+
+
+def _log_listener_failure(error: Exception, delay: float) -> None:
+    """Warn on the first listener failure, then only at DEBUG while Redis stays down."""
+    if delay == INVALIDATION_RECONNECT_SECONDS:
+        logger.warning("⚠️  Cache invalidation listener lost Redis, retrying with backoff: %s", error)
+    else:
+        logger.debug("Cache invalidation listener still can't reach Redis (retry in %ss): %s", delay, error)
+
+
+def start_invalidation_listener() -> None:
+    """
+    Apply invalidations published by the API in a daemon thread (dramatiq worker processes).
+
+    Worker threads reload lazily on their next cache access.
+    """
+    threading.Thread(target=_listen_for_invalidations_sync, name="tenant-cache-invalidation", daemon=True).start()
+
+
+def _listen_for_invalidations_sync() -> None:
+    """Blocking pub/sub loop behind start_invalidation_listener() (resubscribes with backoff)."""
+    import redis
+
+    delay = INVALIDATION_RECONNECT_SECONDS
+    while True:
+        client = None
+        try:
+            client = redis.from_url(master_config.redis_url, decode_responses=True)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_INVALIDATION_CHANNEL)
+            delay = INVALIDATION_RECONNECT_SECONDS
+            for message in pubsub.listen():
+                if message["data"] != _INSTANCE_ID:
+                    invalidate_all()
+        except Exception as e:
+            _log_listener_failure(e, delay)
+            time.sleep(delay)
+            delay = min(delay * 2, INVALIDATION_RECONNECT_MAX_SECONDS)
+        finally:
+            if client is not None:
+                client.close()
+
+
+class _SafeDict(dict):
+    """
+    format_map() mapping that leaves placeholders with no matching variable as-is.
+
+    A miss means the template and its caller disagree on variable names, so it is
+    logged here - format_map() only asks for keys the template actually uses.
+    """
+
+    prompt_key = ""
+
+    def __missing__(self, key: str) -> str:
+        logger.warning("⚠️  Prompt template '%s' has unfilled placeholder {{%s}}", self.prompt_key, key)
+        return "{{" + key + "}}"
+
+
+def _compile_template(template: str, prompt_key: str = "") -> Callable[[Mapping[str, Any]], str]:
+    """
+    Compile a {{var}} template into a render function.
+
+    Literal braces are escaped and each {{var}} becomes a {var} field, so rendering
+    is a single str.format_map() call. Placeholders with no matching variable are
+    left as-is (and logged, see _SafeDict).
+    """
+    escaped = template.replace("{", "{{").replace("}", "}}")
+    converted = _ESCAPED_PLACEHOLDER_RE.sub(r"{\1}", escaped)
+
+    def render(variables: Mapping[str, Any]) -> str:
+        mapping = _SafeDict(variables)
+        mapping.prompt_key = prompt_key
+        return converted.format_map(mapping)
+
+    return render
+
+
 def render_prompt_template(prompt_key: str, variables: Dict[str, str]) -> str:
     """
     Render a prompt template with variable substitution.
@@ -231,105 +1047,80 @@ def render_prompt_template(prompt_key: str, variables: Dict[str, str]) -> str:
             "query_str": "What materials do we use?"
         })
     """
-    template = get_prompt_template(prompt_key)
-
-    if not template:
-        logger.warning(f"⚠️  Prompt template '{prompt_key}' not found")
+    # Refreshes the snapshot (and its precompiled render functions) once the TTL expires
+    render = _get_prompt_snapshot().renderers.get(prompt_key)
+    if render is None:
+        logger.warning("⚠️  Prompt template '%s' not found", prompt_key)
         return ""
 
-    # Simple variable substitution (replace {{var}} with value)
-    rendered = template
-    for var_name, var_value in variables.items():
-        placeholder = f"{{{{{var_name}}}}}"  # {{var_name}}
-        rendered = rendered.replace(placeholder, str(var_value))
+    return render(variables)
 
-    return rendered
 
+def _memoize_per_snapshot(
+    builder: Callable[[_PromptSnapshot, Mapping[str, Any]], str]
+) -> Callable[[], str]:
+    """
+    Memoize a prompt builder on the prompt snapshot + company context it was built from.
 
-def build_ceo_prompt_template() -> str:
+    Results are stored in snapshot.memo, so every publish starts with an empty memo
+    and a result computed from an older snapshot can never be served after a
+    reload. Each call still goes through _get_prompt_snapshot(), so expired
+    prompts are reloaded as usual.
+    """
+    name = builder.__name__
+
+    @functools.wraps(builder)
+    def memoized() -> str:
+        snapshot = _get_prompt_snapshot()
+        context = load_company_context()
+        cached = snapshot.memo.get(name)
+        if cached is not None and cached[0] is context:
+            return cached[1]
+        result = builder(snapshot, context)
+        snapshot.memo[name] = (context, result)
+        return result
+
+    return memoized
+
+
+@_memoize_per_snapshot
+def build_ceo_prompt_template(snapshot: _PromptSnapshot, context: Mapping[str, Any]) -> str:
     """
     Load CEO Assistant prompt template from Supabase (with fallback).
 
-    Used by query_engine.py for response synthesis.
+    Used by query_engine.py for response synthesis (called with no arguments).
+    Memoized per prompt snapshot and company context.
+
+    The result is fed to LlamaIndex's PromptTemplate, which fills single-brace
+    {context_str}/{query_str} fields - so {{var}} placeholders from Supabase
+    are normalized to that syntax here.
     """
     # Try to load template from Supabase
-    logger.info("🔄 Loading ceo_assistant prompt from Supabase...")
-    template = get_prompt_template("ceo_assistant")
+    logger.debug("Loading ceo_assistant prompt")
+    template = snapshot.ceo
 
     if template:
-        logger.info("✅ Loaded ceo_assistant prompt from Supabase (version loaded dynamically)")
-        return template
+        logger.debug("Using ceo_assistant prompt from Supabase")
+        return _PLACEHOLDER_RE.sub(r"{\1}", template)
 
     # Fallback if no template in Supabase
     logger.warning("⚠️  CEO assistant prompt not found in Supabase, using fallback")
-    return """You are an intelligent personal assistant to the CEO. Today's date is {current_date} ({current_date_iso}).
-
-YOUR KNOWLEDGE & CAPABILITIES:
-You have access to the entire company's knowledge - all emails, documents, deals, activities, orders, and everything that goes on in this business. Because of this, you know more about what is happening than anyone. You can access and uncover unique relationships and patterns that would otherwise go unseen.
-
-Below are sub-question answers AND the raw source documents used to create them:
----------------------
-{context_str}
----------------------
-
-YOUR MISSION:
-Take all the information you're given from the retrieved documents and formulate highly informative insights for the CEO. Make cool connections, provide insightful suggestions, and point them in the right direction. Your job is to knock their socks off with how much you know about the business.
-
-CROSS-ANALYSIS APPROACH:
-- You have BOTH synthesized sub-answers AND raw source chunks
-- Use raw chunks to cross-analyze information across different sub-questions
-- Look for patterns: same document references, people, or issues mentioned in multiple chunks
-- Use metadata (dates, document types) to identify related information
-- Connect insights that wouldn't be visible from sub-answers alone
-- If sub-answers conflict, check raw chunks to clarify
-
-DOCUMENT ANALYSIS:
-- Focus on information from actual documents: emails, reports, orders, contracts, invoices
-- Look for connections between different documents (same people, companies, projects)
-- Identify trends over time using document dates
-- Cross-reference information from multiple sources for accuracy
-
-QUOTING & SOURCING:
-- Use direct quotes when they add value: specific numbers, impactful statements, unique insights
-- Keep quotes to 1-2 full sentences maximum
-- Don't quote mundane facts or simple status updates
-- Sub-answers may contain markdown links like "[Document Title](url)" - PRESERVE THESE EXACTLY
-- Cite sources naturally: "The report shows..." or "According to the email from..."
-- Never use technical IDs or database references
-
-STYLE & TONE:
-- Conversational and direct - skip formal report language, greetings, salutations, or sign-offs
-- Speak naturally about connections and relationships as if you inherently know them
-- Provide insights and suggestions proactively
-- Don't make up information not present in the context
-
-FORMATTING (markdown):
-- Emoji section headers (📦 🚨 📊 🚛 💰 ⚡ 🎯) to organize
-- **Bold** for important numbers, names, key points
-- Bullet points and numbered lists for structure
-- Tables for data comparisons
-- ✅/❌ for status indicators
-- Code blocks for metrics/dates/technical details
-
-Question you are answering: {query_str}
-Your answer:"""
-
-
-def build_email_classification_context() -> str:
+    return _load_fallback("ceo")
+
+
+@_memoize_per_snapshot
+def build_email_classification_context(snapshot: _PromptSnapshot, context: Mapping[str, Any]) -> str:
     """
     Build company context for email spam detection.
 
     NOW LOADS FROM SUPABASE! Falls back to building from context if no template found.
 
-    Used by openai_spam_detector.py for filtering emails.
+    Used by openai_spam_detector.py for filtering emails (called with no arguments).
+    Memoized per prompt snapshot and company context.
     """
-    context = get_company_context()
-
-    # Try to load template from Supabase first
-    template = get_prompt_template("email_classifier")
-
-    if template:
-        logger.info("✅ Using email classifier prompt from master Supabase")
+    # Try the template from Supabase first
+    if snapshot.email:
+        logger.debug("Using email classifier prompt from Supabase")
 
         # Build company context section
         context_lines = []
@@ -347,7 +1138,7 @@ def build_email_classification_context() -> str:
 
         # Return the header portion (without batch_emails placeholder)
         # The actual email batch will be added by openai_spam_detector.py
-        return render_prompt_template("email_classifier", {
+        return snapshot.renderers[PROMPT_KEY_EMAIL]({
             "company_name": context["name"],
             "company_location": context["location"],
             "company_context": company_context,
@@ -384,18 +1175,8 @@ def build_vision_ocr_context() -> str:
 
     Used by file_parser.py for business relevance checks.
     """
-    context = get_company_context()
-
-    # Build short description for vision prompts
-    if context["description"]:
-        desc = context["description"][:150]  # Keep it short for prompts
-    else:
-        desc = context["name"]
-
-    if context["capabilities"]:
-        desc += f" - {', '.join(context['capabilities'][:3])}"  # Top 3 capabilities
-
-    return f"{context['name']} ({desc})"
+    # Precomputed at load time (see _freeze_context)
+    return get_company_context()["vision_short_desc"]
 
 
 def get_vision_ocr_business_check_prompt() -> str:
@@ -404,11 +1185,11 @@ def get_vision_ocr_business_check_prompt() -> str:
 
     Returns the template with company context filled in.
     """
-    template = get_prompt_template("vision_ocr_business_check")
+    snapshot = _get_prompt_snapshot()
 
-    if template:
+    if snapshot.vision_business_check:
         company_short_desc = build_vision_ocr_context()
-        return render_prompt_template("vision_ocr_business_check", {
+        return snapshot.renderers[PROMPT_KEY_VISION_BUSINESS_CHECK]({
             "company_short_desc": company_short_desc
         })
     else:
@@ -416,46 +1197,7 @@ def get_vision_ocr_business_check_prompt() -> str:
         context = get_company_context()
         company_desc = f"{context['name']} ({context['description'][:100]})" if context['description'] else context['name']
 
-        return f"""FIRST, classify if this image contains BUSINESS-CRITICAL CONTENT for {company_desc}:
-
-**BUSINESS-CRITICAL content** (KEEP these):
-- Technical documents: CAD drawings, engineering specs, blueprints, schematics, quality reports
-- Business documents: Invoices, purchase orders, quotes, contracts, certificates (CoC, FOD, ISO)
-- Data/Reports: Charts, graphs, spreadsheets with business data, production schedules
-- Product photos: Parts, machinery, materials, prototypes
-- Screenshots: Technical content, work communications, business applications
-
-**NON-BUSINESS content** (SKIP these):
-- Company logos (standalone images without surrounding business content)
-- Email signatures (standalone without email body)
-- Generic marketing graphics, banners, decorative images
-- Personal photos unrelated to business operations
-- Social media graphics, memes, stock photos
-- Small icons, badges, or decorative elements
-
-Start your response with EXACTLY ONE LINE:
-CLASSIFICATION: BUSINESS or SKIP
-
-If SKIP, provide brief reason. If BUSINESS, continue with full extraction:
-
-=== FULL TEXT ===
-[Complete transcription of all visible text]
-
-=== DOCUMENT TYPE ===
-[Type of document]
-
-=== KEY ENTITIES ===
-- Companies: [list]
-- People: [list]
-- Amounts: [list]
-- Dates: [list]
-- Materials/Products: [list]
-- Reference Numbers: [list]
-
-=== CONTEXT ===
-[Brief description of what this document is about and its purpose]
-
-Be thorough and extract EVERYTHING visible."""
+        return _load_fallback("vision_business").format(company_desc=company_desc)
 
 
 def get_vision_ocr_extract_prompt() -> str:
@@ -464,68 +1206,30 @@ def get_vision_ocr_extract_prompt() -> str:
 
     Returns the template from database (no variables needed).
     """
-    template = get_prompt_template("vision_ocr_extract")
+    vision_extract = _get_prompt_snapshot().vision_extract
 
-    if template:
-        return template
+    if vision_extract:
+        return vision_extract
     else:
         # Fallback - generalized text extraction prompt
-        return """Analyze this document/image and provide a comprehensive extraction:
-
-1. **Full Text Transcription**: Extract ALL text visible in the image (OCR)
-2. **Document Type**: What kind of document is this? (invoice, receipt, email, form, diagram, contract, etc.)
-3. **Key Information**: Extract important details:
-   - Companies/Organizations mentioned
-   - People (names, roles, emails)
-   - Monetary amounts and currencies
-   - Dates and deadlines
-   - Materials, products, or items
-   - Order numbers, invoice numbers, PO numbers
-   - Certifications or standards mentioned
-4. **Context**: What is this document about? What's the main purpose or subject?
-
-Format your response as:
-
-=== FULL TEXT ===
-[Complete transcription of all visible text]
-
-=== DOCUMENT TYPE ===
-[Type of document]
-
-=== KEY ENTITIES ===
-- Companies: [list]
-- People: [list]
-- Amounts: [list]
-- Dates: [list]
-- Materials/Products: [list]
-- Reference Numbers: [list]
-
-=== CONTEXT ===
-[Brief description of what this document is about and its purpose]
-
-Be thorough and extract EVERYTHING visible, including:
-- Handwritten text
-- Text in tables, forms, and diagrams
-- Watermarks and stamps
-- Header/footer information
-- Small print and fine details"""
+        return _load_fallback("vision_extract")
 
 
 def get_company_name() -> str:
     """Get company name only."""
-    return get_company_context()["name"]
+    return load_company_context()["name"]
 
 
 def get_company_description() -> str:
     """Get company description only."""
-    return get_company_context()["description"]
+    return load_company_context()["description"]
 
 
 def get_company_location() -> str:
     """Get company location only."""
-    return get_company_context()["location"]
+    return load_company_context()["location"]
 
 
-def get_team_members() -> List[Dict]:
-    """Get team members list only."""
-    return get_company_context()["team"]
+def get_team_members() -> Tuple[Mapping[str, Any], ...]:
+    """Get team members only (read-only)."""
+    return load_company_context()["team"]
@@ -18,11 +18,12 @@ Author: ThunderbirdLabs
 License: Proprietary
 """
 import sys
+import asyncio
 import logging
 import traceback
-import nest_asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, APIRouter
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Startup error handling
 try:
@@ -34,6 +35,7 @@ try:
     from app.middleware.error_handler import ErrorHandlerMiddleware
     from app.middleware.logging import RequestLoggingMiddleware
     from app.middleware.cors import get_cors_middleware
+    from app.middleware.compression import GZipRequestMiddleware
 
     # Import routes (only active routes, no dead code)
     from app.api.v1.routes.health import router as health_router
@@ -44,22 +46,13 @@ try:
     from app.api.v1.routes.chat import router as chat_router
     from app.api.v1.routes.upload import router as upload_router
     from app.api.v1.routes.users import router as users_router
+    from app.api.v1.routes.tenant import router as tenant_router
 
 except Exception as e:
     print(f"🚨 FATAL STARTUP ERROR: {e}", file=sys.stderr)
     print(f"Traceback:\n{traceback.format_exc()}", file=sys.stderr)
     sys.exit(1)
 
-# Enable nested asyncio for LlamaIndex compatibility
-try:
-    import asyncio
-    loop = asyncio.get_event_loop()
-    if not isinstance(loop, type(asyncio.new_event_loop())):
-        pass
-except Exception as e:
-    print(f"Applying nest_asyncio: {e}")
-    nest_asyncio.apply()
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO if settings.environment == "production" else logging.DEBUG,
@@ -111,6 +104,18 @@ async def lifespan(app: FastAPI):
 
     await initialize_clients()
 
+    # Warm company context + prompt caches before accepting traffic
+    # (served from the disk cache when fresh, refreshed from Supabase in the background)
+    from app.services.tenant.context import (
+        warm_caches, refresh_caches_periodically, listen_for_invalidations, close_pg_client
+    )
+    await warm_caches()
+
+    # Keep them fresh so company/prompt edits apply without a restart, and apply
+    # invalidations published by whichever process received the webhook
+    refresh_task = asyncio.create_task(refresh_caches_periodically())
+    invalidation_task = asyncio.create_task(listen_for_invalidations())
+
     logger.info("=" * 80)
     logger.info("✅ HighForce started successfully")
     logger.info("=" * 80)
@@ -119,6 +124,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down HighForce...")
+    background_tasks = (refresh_task, invalidation_task)
+    for task in background_tasks:
+        task.cancel()
+    # return_exceptions: a task that already died must not skip the cleanup below
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await close_pg_client()
     await shutdown_clients()
     logger.info("✅ Shutdown complete")
 
@@ -152,55 +163,67 @@ logger.info("✅ Rate limiting enabled")
 # MIDDLEWARE (order matters!)
 # ============================================================================
 
-# Security headers (must be first to apply to all responses)
 from app.middleware.security_headers import SecurityHeadersMiddleware
-app.add_middleware(SecurityHeadersMiddleware)
-logger.info("✅ Security headers enabled")
 
-# CORS (after security headers)
 cors_middleware, cors_config = get_cors_middleware()
-app.add_middleware(cors_middleware, **cors_config)
 
-# Request logging
-app.add_middleware(RequestLoggingMiddleware)
+MIDDLEWARE = (
+    (SecurityHeadersMiddleware, {}),     # Security headers (must be first to apply to all responses)
+    (GZipMiddleware, {"minimum_size": 1000, "compresslevel": 5}),  # Compress JSON responses > 1 KB
+    (GZipRequestMiddleware, {}),         # Inflate gzip request bodies
+    (cors_middleware, cors_config),      # CORS (after security headers)
+    (RequestLoggingMiddleware, {}),      # Request logging
+    (ErrorHandlerMiddleware, {}),        # Global error handler (must be last)
+)
+
+for middleware_class, middleware_options in MIDDLEWARE:
+    app.add_middleware(middleware_class, **middleware_options)
 
-# Global error handler (must be last)
-app.add_middleware(ErrorHandlerMiddleware)
+logger.info("✅ Security headers enabled")
 
 # ============================================================================
 # ROUTES (Clean registration - no dead code)
 # ============================================================================
 
-app.include_router(health_router)
-app.include_router(oauth_router)
-app.include_router(webhook_router)
-app.include_router(sync_router)
-app.include_router(search_router)
-app.include_router(chat_router)
-app.include_router(upload_router)
-app.include_router(users_router)
+ROUTERS = (
+    health_router,
+    oauth_router,
+    webhook_router,
+    sync_router,
+    search_router,
+    chat_router,
+    upload_router,
+    users_router,
+    tenant_router,
+)
+
+for router in ROUTERS:
+    app.include_router(router)
 
 logger.info("✅ All routes registered")
 
 # ============================================================================
-# SENTRY DEBUG ENDPOINT (DEV/STAGING ONLY)
+# SENTRY DEBUG ENDPOINT (OPT-IN, NEVER IN PRODUCTION)
 # ============================================================================
 
-if settings.environment != "production":
-    @app.get("/sentry-debug")
+if settings.enable_sentry_debug and settings.environment != "production":
+    sentry_debug_router = APIRouter(include_in_schema=False)
+
+    @sentry_debug_router.get("/sentry-debug")
     async def trigger_sentry_error():
         """
         Test endpoint to verify Sentry error tracking is working.
         Triggers a division by zero error that gets captured by Sentry.
 
-        SECURITY: Only available in dev/staging (disabled in production)
+        SECURITY: Only registered when ENABLE_SENTRY_DEBUG=1 outside production
         """
         division_by_zero = 1 / 0
         return {"should": "never reach here"}
 
-    logger.info("⚠️  DEV MODE: Sentry debug endpoint enabled at /sentry-debug")
+    app.include_router(sentry_debug_router)
+    logger.info("⚠️  DEBUG: Sentry debug endpoint enabled at /sentry-debug")
 else:
-    logger.info("✅ PRODUCTION: Sentry debug endpoint disabled")
+    logger.info("✅ Sentry debug endpoint disabled")
 
 # ============================================================================
 # MAIN
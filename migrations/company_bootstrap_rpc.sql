@@ -0,0 +1,54 @@
+-- ============================================================================
+-- COMPANY BOOTSTRAP RPC
+-- ============================================================================
+-- Returns everything the backend caches per company in ONE round-trip:
+--   - company: companies row
+--   - team:    active company_team_members rows
+--   - prompts: active company_prompts rows (prompt_key, prompt_template)
+--
+-- Called from app/services/tenant/context.py (_load_bootstrap) via
+-- supabase.rpc("get_company_bootstrap", {"cid": company_id}) instead of
+-- three separate PostgREST requests.
+--
+-- TARGET DATABASE: the Supabase project the backend's master client points at
+-- (SUPABASE_URL) - the one holding the tenant config tables context.py reads:
+-- companies, company_team_members and company_prompts. The last two are NOT
+-- created by 001_unified_schema.sql, so this file is deliberately unnumbered:
+-- apply it manually once those tables exist (a LANGUAGE sql body is checked
+-- at CREATE time and fails against the 001 schema alone).
+--
+-- SECURITY:
+-- - Runs with the caller's rights (no SECURITY DEFINER) - RLS still applies
+-- - Only service_role may execute it; PostgREST would otherwise expose it at
+--   /rest/v1/rpc/get_company_bootstrap to anyone holding the anon key
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION get_company_bootstrap(cid UUID)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'company', (
+            SELECT to_jsonb(c)
+            FROM companies c
+            WHERE c.id = cid
+        ),
+        'team', COALESCE((
+            SELECT jsonb_agg(to_jsonb(t))
+            FROM company_team_members t
+            WHERE t.company_id = cid
+              AND t.is_active = TRUE
+        ), '[]'::jsonb),
+        'prompts', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'prompt_key', p.prompt_key,
+                'prompt_template', p.prompt_template
+            ))
+            FROM company_prompts p
+            WHERE p.company_id = cid
+              AND p.is_active = TRUE
+        ), '[]'::jsonb)
+    );
+$$ LANGUAGE sql STABLE
+SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION get_company_bootstrap(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_company_bootstrap(UUID) TO service_role;
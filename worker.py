@@ -3,27 +3,50 @@ Dramatiq Background Worker
 Processes long-running sync jobs (Gmail, Drive, Outlook, QuickBooks) asynchronously
 
 Usage:
-    dramatiq worker -p 4 -t 4
+    dramatiq worker -p ${WORKER_PROCESSES:-4} -t ${WORKER_THREADS:-8}
+
+    -t must match WORKER_THREADS (queue prefetch is sized from the env var).
 
 Deployment (Render):
     - Type: Background Worker
     - Build Command: pip install -r requirements.txt
-    - Start Command: dramatiq worker -p 4 -t 4
+    - Start Command: dramatiq worker -p ${WORKER_PROCESSES:-4} -t ${WORKER_THREADS:-8}
     - Environment: Same as main app (REDIS_URL, SUPABASE_URL, etc.)
+    - Queues: WORKER_QUEUES (default "default"; e.g. "default,alerts")
+    - Concurrency: WORKER_PROCESSES / WORKER_THREADS (sync tasks are I/O-bound,
+      so raise threads to 16-32 in production rather than adding processes)
 
 Author: ThunderbirdLabs
 Version: 1.0.0
 """
+import importlib
 import logging
 import os
 
+import dramatiq.worker as dramatiq_worker
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"  # Whole seconds - skips the per-record msec formatting
 )
 logger = logging.getLogger(__name__)
 
+# Concurrency (passed to the dramatiq CLI by the start command - see docstring).
+# The start command must pass -t $WORKER_THREADS: prefetch below is sized from the
+# env var, not from whatever -t the CLI actually received.
+PROCESSES = int(os.getenv("WORKER_PROCESSES", "4"))
+THREADS = int(os.getenv("WORKER_THREADS", "8"))
+
+# Messages each worker process reserves from Redis. Dramatiq's default (2 per thread)
+# lets one process hoard long sync jobs while others sit idle - cap it at one per thread.
+# Dramatiq reads dramatiq_queue_prefetch at import (0 = its default) and uses the module
+# value when the Worker is built, after this module is imported - an explicit env var wins.
+if not dramatiq_worker.QUEUE_PREFETCH:
+    dramatiq_worker.QUEUE_PREFETCH = THREADS
+PREFETCH = dramatiq_worker.QUEUE_PREFETCH
+
 # Initialize Sentry for error tracking (if configured)
 sentry_dsn = os.getenv("SENTRY_DSN")
 if sentry_dsn:
@@ -34,10 +57,14 @@ if sentry_dsn:
         sentry_sdk.init(
             dsn=sentry_dsn,
             environment=os.getenv("ENVIRONMENT", "production"),
-            traces_sample_rate=0.1,  # 10% of requests for performance monitoring
-            profiles_sample_rate=0.1,
+            traces_sample_rate=0.01,  # 1% - sync tasks are long and I/O-bound, tracing is per-span overhead
+            profiles_sample_rate=0.01,
+            max_breadcrumbs=20,
+            send_default_pii=False,
+            attach_stacktrace=False,
             integrations=[
-                LoggingIntegration(level=logging.INFO, event_level=logging.ERROR)
+                # Only WARNING+ become breadcrumbs (busy sync tasks log thousands of INFO lines)
+                LoggingIntegration(level=logging.WARNING, event_level=logging.ERROR)
             ]
         )
         logger.info("✅ Sentry initialized in worker")
@@ -46,18 +73,39 @@ if sentry_dsn:
 else:
     logger.info("ℹ️  Sentry not configured (SENTRY_DSN not set)")
 
+# Task modules per queue. Dramatiq only consumes queues whose actors are registered,
+# so a worker imports (and pages in the dependencies of) only the queues it serves.
+TASK_MODULES = {
+    "default": "app.services.jobs.tasks",       # sync_gmail, sync_outlook, sync_drive, sync_quickbooks
+    "alerts": "app.services.jobs.alert_tasks",  # document urgency detection
+}
+
+# Comma-separated queues this worker serves (e.g. WORKER_QUEUES=alerts for an alerts-only fleet)
+WORKER_QUEUES = [queue.strip() for queue in os.getenv("WORKER_QUEUES", "default").split(",") if queue.strip()]
+
 # Import tasks (this registers them with Dramatiq)
 try:
-    from app.services.jobs.broker import broker
-    from app.services.jobs.tasks import (
-        sync_gmail_task,
-        sync_outlook_task,
-        sync_drive_task,
-        sync_quickbooks_task
-    )
+    from app.services.jobs.broker import broker, HIREDIS_AVAILABLE
+
+    # Production workers must use the C reply parser (see requirements.txt: redis[hiredis])
+    if not HIREDIS_AVAILABLE and os.getenv("ENVIRONMENT", "production") == "production":
+        raise RuntimeError("hiredis is not installed - install redis[hiredis] for the worker")
+
+    unknown_queues = set(WORKER_QUEUES) - TASK_MODULES.keys()
+    if unknown_queues:
+        raise ValueError(f"Unknown WORKER_QUEUES {sorted(unknown_queues)} (expected: {', '.join(TASK_MODULES)})")
+
+    for queue in WORKER_QUEUES:
+        importlib.import_module(TASK_MODULES[queue])
+
+    # Drop cached company context/prompts when the API's invalidation webhook fires
+    from app.services.tenant.context import start_invalidation_listener
+    start_invalidation_listener()
 
     logger.info("✅ HighForce worker initialized")
-    logger.info("📋 Registered tasks: sync_gmail, sync_outlook, sync_drive, sync_quickbooks")
+    logger.info(f"⚙️  Concurrency: {PROCESSES} processes × {THREADS} threads (prefetch {PREFETCH})")
+    logger.info(f"📋 Queues: {', '.join(WORKER_QUEUES)}")
+    logger.info(f"📋 Registered tasks: {', '.join(sorted(broker.get_declared_actors()))}")
 
 except Exception as e:
     logger.error(f"❌ Failed to initialize worker: {e}", exc_info=True)